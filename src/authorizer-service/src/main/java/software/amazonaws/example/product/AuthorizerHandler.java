@@ -10,15 +10,27 @@ import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 import org.slf4j.MDC;
 
+import java.nio.charset.StandardCharsets;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
+import java.util.Collections;
 import java.util.HashMap;
+import java.util.HashSet;
 import java.util.Map;
+import java.util.Set;
 
 public class AuthorizerHandler implements RequestHandler<APIGatewayCustomAuthorizerEvent, Map<String, Object>> {
     private static final Logger LOGGER = LoggerFactory.getLogger(AuthorizerHandler.class);
     private static final ObjectMapper OBJECT_MAPPER = new ObjectMapper();
 
+    // SHA-256 hex digests of accepted API keys, loaded once per container so
+    // the hot path never round-trips to a secrets store. Keys are compared by
+    // digest, so validation cost is independent of how much of a candidate
+    // key matches any stored key.
+    private final Set<String> validKeyHashes = loadValidKeyHashes();
+
     @Override
-    @Logging(logEvent = true)
+    @Logging
     @Tracing
     public Map<String, Object> handleRequest(APIGatewayCustomAuthorizerEvent request, Context context) {
         try {
@@ -36,8 +48,7 @@ public class AuthorizerHandler implements RequestHandler<APIGatewayCustomAuthori
                 }
             }
 
-            // Simple validation - in production, validate against stored keys
-            boolean isAuthorized = apiKey != null && !apiKey.trim().isEmpty();
+            boolean isAuthorized = isValidApiKey(apiKey);
 
             MDC.put("isAuthorized", String.valueOf(isAuthorized));
             LOGGER.info("Authorization result determined");
@@ -66,4 +77,47 @@ public class AuthorizerHandler implements RequestHandler<APIGatewayCustomAuthori
             return response;
         }
     }
-}
\ No newline at end of file
+
+    private boolean isValidApiKey(String apiKey) {
+        if (apiKey == null || apiKey.trim().isEmpty()) {
+            return false;
+        }
+        if (validKeyHashes.isEmpty()) {
+            // No key material configured - keep the presence-only check
+            return true;
+        }
+        return validKeyHashes.contains(sha256Hex(apiKey));
+    }
+
+    private static Set<String> loadValidKeyHashes() {
+        String configured = System.getenv("API_KEY_HASHES");
+        if (configured == null) {
+            configured = System.getProperty("API_KEY_HASHES");
+        }
+        if (configured == null || configured.trim().isEmpty()) {
+            return Collections.emptySet();
+        }
+        Set<String> hashes = new HashSet<>();
+        for (String hash : configured.split(",")) {
+            if (!hash.trim().isEmpty()) {
+                hashes.add(hash.trim().toLowerCase());
+            }
+        }
+        return Collections.unmodifiableSet(hashes);
+    }
+
+    private static String sha256Hex(String value) {
+        try {
+            MessageDigest digest = MessageDigest.getInstance("SHA-256");
+            byte[] hashed = digest.digest(value.getBytes(StandardCharsets.UTF_8));
+            StringBuilder hex = new StringBuilder(hashed.length * 2);
+            for (byte b : hashed) {
+                hex.append(Character.forDigit((b >> 4) & 0xF, 16));
+                hex.append(Character.forDigit(b & 0xF, 16));
+            }
+            return hex.toString();
+        } catch (NoSuchAlgorithmException e) {
+            throw new IllegalStateException("SHA-256 not available", e);
+        }
+    }
+}
@@ -2,11 +2,14 @@ package software.amazonaws.example.product;
 
 import com.amazonaws.services.lambda.runtime.Context;
 import com.amazonaws.services.lambda.runtime.events.APIGatewayCustomAuthorizerEvent;
+import org.junit.jupiter.api.AfterEach;
 import org.junit.jupiter.api.BeforeEach;
 import org.junit.jupiter.api.Test;
 import org.mockito.Mock;
 import org.mockito.MockitoAnnotations;
 
+import java.nio.charset.StandardCharsets;
+import java.security.MessageDigest;
 import java.util.HashMap;
 import java.util.Map;
 
@@ -34,6 +37,11 @@ class AuthorizerHandlerTest {
         when(mockContext.getFunctionName()).thenReturn("authorizer-service-test");
     }
 
+    @AfterEach
+    void tearDown() {
+        System.clearProperty("API_KEY_HASHES");
+    }
+
     // Valid API Key Tests
     @Test
     void handleRequest_ValidApiKeyInXApiKeyHeader_ShouldAuthorize() {
@@ -288,6 +296,75 @@ class AuthorizerHandlerTest {
         assertEquals(specialKey, context.get("apiKey"));
     }
 
+    // Configured Key Hash Tests
+    @Test
+    void handleRequest_ConfiguredHashes_ShouldAuthorizeMatchingKey() throws Exception {
+        // Arrange
+        System.setProperty("API_KEY_HASHES", sha256Hex("configured-key"));
+        AuthorizerHandler hashAwareHandler = new AuthorizerHandler();
+        APIGatewayCustomAuthorizerEvent event = createAuthorizerEvent();
+        Map<String, String> headers = new HashMap<>();
+        headers.put("x-api-key", "configured-key");
+        event.setHeaders(headers);
+
+        // Act
+        Map<String, Object> response = hashAwareHandler.handleRequest(event, mockContext);
+
+        // Assert
+        assertTrue((Boolean) response.get("isAuthorized"));
+        Map<String, Object> context = (Map<String, Object>) response.get("context");
+        assertEquals("configured-key", context.get("apiKey"));
+    }
+
+    @Test
+    void handleRequest_ConfiguredHashes_ShouldDenyUnknownKey() throws Exception {
+        // Arrange
+        System.setProperty("API_KEY_HASHES", sha256Hex("configured-key"));
+        AuthorizerHandler hashAwareHandler = new AuthorizerHandler();
+        APIGatewayCustomAuthorizerEvent event = createAuthorizerEvent();
+        Map<String, String> headers = new HashMap<>();
+        headers.put("x-api-key", "some-other-key");
+        event.setHeaders(headers);
+
+        // Act
+        Map<String, Object> response = hashAwareHandler.handleRequest(event, mockContext);
+
+        // Assert
+        assertFalse((Boolean) response.get("isAuthorized"));
+        Map<String, Object> context = (Map<String, Object>) response.get("context");
+        assertEquals("invalid", context.get("apiKey"));
+    }
+
+    @Test
+    void handleRequest_MultipleConfiguredHashes_ShouldAuthorizeAnyMatchingKey() throws Exception {
+        // Arrange
+        System.setProperty("API_KEY_HASHES",
+                sha256Hex("first-key") + "," + sha256Hex("second-key"));
+        AuthorizerHandler hashAwareHandler = new AuthorizerHandler();
+        APIGatewayCustomAuthorizerEvent event = createAuthorizerEvent();
+        Map<String, String> headers = new HashMap<>();
+        headers.put("x-api-key", "second-key");
+        event.setHeaders(headers);
+
+        // Act
+        Map<String, Object> response = hashAwareHandler.handleRequest(event, mockContext);
+
+        // Assert
+        assertTrue((Boolean) response.get("isAuthorized"));
+        Map<String, Object> context = (Map<String, Object>) response.get("context");
+        assertEquals("second-key", context.get("apiKey"));
+    }
+
+    // Helper method to compute the hex digest stored in API_KEY_HASHES
+    private String sha256Hex(String value) throws Exception {
+        MessageDigest digest = MessageDigest.getInstance("SHA-256");
+        StringBuilder hex = new StringBuilder();
+        for (byte b : digest.digest(value.getBytes(StandardCharsets.UTF_8))) {
+            hex.append(String.format("%02x", b));
+        }
+        return hex.toString();
+    }
+
     // Helper method to create a basic authorizer event
     private APIGatewayCustomAuthorizerEvent createAuthorizerEvent() {
         APIGatewayCustomAuthorizerEvent event = new APIGatewayCustomAuthorizerEvent();
@@ -0,0 +1,107 @@
+# Audit event processor Lambda
+# Routes application events from EventBridge into the DynamoDB audit log table
+
+data "archive_file" "event_processor_lambda" {
+  type        = "zip"
+  output_path = "${path.module}/../build/event-processor.zip"
+
+  source {
+    content  = file("${path.module}/scripts/event-processor.py")
+    filename = "lambda_function.py"
+  }
+}
+
+resource "aws_lambda_function" "event_processor" {
+  filename         = data.archive_file.event_processor_lambda.output_path
+  function_name    = "${local.function_base_name}-event-processor"
+  role             = aws_iam_role.event_processor_role.arn
+  handler          = "lambda_function.lambda_handler"
+  source_code_hash = data.archive_file.event_processor_lambda.output_base64sha256
+  runtime          = "python3.12"
+  timeout          = 60
+
+  environment {
+    variables = {
+      AUDIT_TABLE_NAME = module.audit_logs_table.dynamodb_table_id
+      LOG_LEVEL        = "INFO"
+    }
+  }
+
+  tags = local.common_tags
+}
+
+# IAM role for event processor function
+resource "aws_iam_role" "event_processor_role" {
+  name = "${local.function_base_name}-event-processor-role"
+
+  assume_role_policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Action = "sts:AssumeRole"
+        Effect = "Allow"
+        Principal = {
+          Service = "lambda.amazonaws.com"
+        }
+      }
+    ]
+  })
+
+  tags = local.common_tags
+}
+
+resource "aws_iam_role_policy" "event_processor_policy" {
+  name = "${local.function_base_name}-event-processor-policy"
+  role = aws_iam_role.event_processor_role.id
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Action = [
+          "logs:CreateLogGroup",
+          "logs:CreateLogStream",
+          "logs:PutLogEvents"
+        ]
+        Resource = "arn:aws:logs:*:*:*"
+      },
+      {
+        Effect = "Allow"
+        Action = [
+          "dynamodb:PutItem",
+          "dynamodb:BatchWriteItem"
+        ]
+        Resource = [
+          module.audit_logs_table.dynamodb_table_arn
+        ]
+      }
+    ]
+  })
+}
+
+# EventBridge rule routing application events to the processor
+resource "aws_cloudwatch_event_rule" "audit_events" {
+  name        = "${local.function_base_name}-audit-events"
+  description = "Route application events to the audit event processor"
+
+  event_pattern = jsonencode({
+    source = [{ prefix = local.project_name }]
+  })
+
+  tags = local.common_tags
+}
+
+resource "aws_cloudwatch_event_target" "audit_events_target" {
+  rule      = aws_cloudwatch_event_rule.audit_events.name
+  target_id = "AuditEventProcessorTarget"
+  arn       = aws_lambda_function.event_processor.arn
+}
+
+resource "aws_lambda_permission" "event_processor_permission" {
+  statement_id  = "AllowExecutionFromEventBridge"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.event_processor.function_name
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.audit_events.arn
+}
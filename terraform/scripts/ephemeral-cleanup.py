@@ -9,9 +9,87 @@ This helps manage costs and prevents resource accumulation from development work
 import json
 import boto3
 import os
-from datetime import datetime, timedelta
+import threading
+import time
+from botocore.config import Config
+from botocore.exceptions import ClientError, WaiterError
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List
 
+# Keep pooled HTTPS connections alive across sparse invocations and let the
+# SDK pace retries adaptively instead of failing fast under throttling
+BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# Module-scope clients so warm Lambda containers reuse connections and
+# resolved credentials instead of rebuilding them on every invocation
+DDB = boto3.client('dynamodb', config=BOTO_CONFIG)
+S3 = boto3.client('s3', config=BOTO_CONFIG)
+EVENTS = boto3.client('events', config=BOTO_CONFIG)
+LOGS = boto3.client('logs', config=BOTO_CONFIG)
+
+UTC = timezone.utc
+
+# Guards cleanup_results while the cleanup phases run concurrently
+_results_lock = threading.Lock()
+
+# Lightweight per-resource outcome record kept in the hot deletion loops;
+# converted to dicts only at the JSON response boundary
+Result = namedtuple('Result', ['type', 'name', 'status', 'error'], defaults=(None,))
+
+# Per-phase fan-out for individual resource deletions
+DELETE_WORKERS = 10
+
+# S3 DeleteObjects accepts at most 1000 keys per call
+S3_DELETE_BATCH = 1000
+
+# Shared budget for confirming DynamoDB table deletions; the Lambda itself
+# times out at 300s, so the confirmation pass must never consume the whole
+# invocation
+TABLE_WAIT_BUDGET_SECONDS = 120
+TABLE_WAIT_DELAY_SECONDS = 5
+
+def error_code(e: ClientError) -> str:
+    """
+    Extract the service error code from a ClientError
+    """
+    return e.response.get('Error', {}).get('Code', '')
+
+def run_deletions(delete_one, names: List) -> None:
+    """
+    Fan out per-resource deletions across a bounded worker pool
+    """
+    if not names:
+        return
+    with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, len(names))) as executor:
+        futures = [executor.submit(delete_one, name) for name in names]
+        for future in futures:
+            future.result()
+
+def record_result(results: Dict, entry: Result) -> None:
+    """
+    Thread-safe append to the shared resources_cleaned list
+    """
+    with _results_lock:
+        results['resources_cleaned'].append(entry)
+
+def serialize_results(results: Dict) -> Dict:
+    """
+    Convert the Result records to dicts for the JSON response body
+    """
+    return {
+        **results,
+        'resources_cleaned': [
+            {k: v for k, v in entry._asdict().items() if v is not None}
+            for entry in results['resources_cleaned']
+        ]
+    }
+
 def lambda_handler(event, context):
     """
     Main Lambda handler for ephemeral environment cleanup
@@ -31,31 +109,39 @@ def lambda_handler(event, context):
     cleanup_results = {
         'environment_prefix': environment_prefix,
         'auto_destroy_hours': auto_destroy_hours,
-        'cleanup_timestamp': datetime.utcnow().isoformat(),
+        'cleanup_timestamp': datetime.now(UTC).isoformat(),
         'resources_cleaned': []
     }
     
     try:
+        # Enumerate matching tables once and share the walk between the age
+        # check and the DynamoDB cleanup phase
+        try:
+            env_tables = _list_env_tables(environment_prefix)
+        except ClientError as e:
+            print(f"Error listing DynamoDB tables: {str(e)}")
+            env_tables = []
+        
         # Check if environment is old enough to be cleaned up
-        if not should_cleanup_environment(environment_prefix, auto_destroy_hours):
+        if not should_cleanup_environment(environment_prefix, auto_destroy_hours, env_tables):
             cleanup_results['action'] = 'skipped'
             cleanup_results['reason'] = 'Environment not old enough for cleanup'
             return {
                 'statusCode': 200,
-                'body': json.dumps(cleanup_results)
+                'body': json.dumps(serialize_results(cleanup_results))
             }
         
-        # Cleanup DynamoDB tables
-        cleanup_dynamodb_tables(environment_prefix, cleanup_results)
-        
-        # Cleanup S3 buckets
-        cleanup_s3_buckets(environment_prefix, cleanup_results)
-        
-        # Cleanup EventBridge custom buses
-        cleanup_eventbridge_buses(environment_prefix, cleanup_results)
-        
-        # Cleanup CloudWatch log groups
-        cleanup_cloudwatch_logs(environment_prefix, cleanup_results)
+        # DynamoDB, S3, EventBridge, and CloudWatch Logs are independent
+        # services, so the four phases run concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(cleanup_dynamodb_tables, environment_prefix, cleanup_results, env_tables),
+                executor.submit(cleanup_s3_buckets, environment_prefix, cleanup_results),
+                executor.submit(cleanup_eventbridge_buses, environment_prefix, cleanup_results),
+                executor.submit(cleanup_cloudwatch_logs, environment_prefix, cleanup_results)
+            ]
+            for future in futures:
+                future.result()
         
         cleanup_results['action'] = 'completed'
         cleanup_results['status'] = 'success'
@@ -64,7 +150,7 @@ def lambda_handler(event, context):
         
         return {
             'statusCode': 200,
-            'body': json.dumps(cleanup_results)
+            'body': json.dumps(serialize_results(cleanup_results))
         }
         
     except Exception as e:
@@ -75,31 +161,41 @@ def lambda_handler(event, context):
         
         return {
             'statusCode': 500,
-            'body': json.dumps(cleanup_results)
+            'body': json.dumps(serialize_results(cleanup_results))
         }
 
-def should_cleanup_environment(environment_prefix: str, auto_destroy_hours: int) -> bool:
+def _list_env_tables(environment_prefix: str) -> List[str]:
+    """
+    List DynamoDB tables matching the environment prefix via the list_tables
+    paginator, stopping early once the sorted names pass the prefix range
+    """
+    env_tables = []
+    for page in DDB.get_paginator('list_tables').paginate():
+        for name in page['TableNames']:
+            if name.startswith(environment_prefix):
+                env_tables.append(name)
+            elif name > environment_prefix:
+                # Table names are returned sorted, so nothing later can match
+                return env_tables
+    return env_tables
+
+def should_cleanup_environment(environment_prefix: str, auto_destroy_hours: int, env_tables: List[str]) -> bool:
     """
     Check if the environment is old enough to be cleaned up based on resource creation time
     """
     try:
         # Check DynamoDB table creation time as a proxy for environment age
-        dynamodb = boto3.client('dynamodb')
-        
-        tables = dynamodb.list_tables()['TableNames']
-        env_tables = [table for table in tables if table.startswith(environment_prefix)]
-        
         if not env_tables:
             print(f"No tables found for environment {environment_prefix}, considering for cleanup")
             return True
         
         # Check the creation time of the first table found
         table_name = env_tables[0]
-        table_info = dynamodb.describe_table(TableName=table_name)
+        table_info = DDB.describe_table(TableName=table_name)
         creation_time = table_info['Table']['CreationDateTime']
         
-        # Calculate age
-        age = datetime.utcnow() - creation_time.replace(tzinfo=None)
+        # Calculate age; boto3 returns timezone-aware creation times
+        age = datetime.now(UTC) - creation_time
         age_hours = age.total_seconds() / 3600
         
         print(f"Environment age: {age_hours:.2f} hours (threshold: {auto_destroy_hours} hours)")
@@ -110,146 +206,179 @@ def should_cleanup_environment(environment_prefix: str, auto_destroy_hours: int)
         print(f"Error checking environment age: {str(e)}, proceeding with cleanup")
         return True
 
-def cleanup_dynamodb_tables(environment_prefix: str, results: Dict) -> None:
+def cleanup_dynamodb_tables(environment_prefix: str, results: Dict, env_tables: List[str]) -> None:
     """
-    Delete DynamoDB tables matching the environment prefix
+    Delete the DynamoDB tables precomputed for the environment prefix
     """
-    dynamodb = boto3.client('dynamodb')
-    
+    deleting = []
+
+    def delete_table(table_name: str) -> None:
+        try:
+            print(f"Deleting DynamoDB table: {table_name}")
+            DDB.delete_table(TableName=table_name)
+            with _results_lock:
+                deleting.append(table_name)
+            record_result(results, Result('dynamodb_table', table_name, 'deleted'))
+        except ClientError as e:
+            if error_code(e) == 'ResourceNotFoundException':
+                # Already gone - idempotent success
+                record_result(results, Result('dynamodb_table', table_name, 'deleted'))
+                return
+            print(f"Error deleting table {table_name}: {str(e)}")
+            record_result(results, Result('dynamodb_table', table_name, 'error', str(e)))
+
+    run_deletions(delete_table, env_tables)
+
+    # DeleteTable only initiates deletion, so once every request is in
+    # flight confirm completion in a single wait pass. All tables share one
+    # deadline so a slow deletion cannot starve the rest of the invocation
+    waiter = DDB.get_waiter('table_not_exists')
+    deadline = time.monotonic() + TABLE_WAIT_BUDGET_SECONDS
+    for table_name in deleting:
+        max_attempts = int((deadline - time.monotonic()) // TABLE_WAIT_DELAY_SECONDS)
+        if max_attempts < 1:
+            print(f"Wait budget exhausted before confirming deletion of table {table_name}")
+            break
+        try:
+            waiter.wait(
+                TableName=table_name,
+                WaiterConfig={'Delay': TABLE_WAIT_DELAY_SECONDS, 'MaxAttempts': max_attempts}
+            )
+        except (ClientError, WaiterError) as e:
+            print(f"Error waiting for table {table_name} deletion: {str(e)}")
+
+def empty_bucket(bucket_name: str) -> None:
+    """
+    Delete every object in a bucket using paginated listings and parallel
+    DeleteObjects batches so buckets with more than 1000 keys empty fully
+    """
+    def delete_batch(batch: List) -> None:
+        S3.delete_objects(
+            Bucket=bucket_name,
+            Delete={'Objects': batch, 'Quiet': True}
+        )
+
+    def delete_in_batches(targets: List) -> None:
+        if not targets:
+            return
+        batches = [targets[i:i + S3_DELETE_BATCH] for i in range(0, len(targets), S3_DELETE_BATCH)]
+        with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, len(batches))) as executor:
+            futures = [executor.submit(delete_batch, batch) for batch in batches]
+            for future in futures:
+                future.result()
+
+    keys = []
+    for page in S3.get_paginator('list_objects_v2').paginate(Bucket=bucket_name):
+        keys.extend({'Key': obj['Key']} for obj in page.get('Contents', []))
+    delete_in_batches(keys)
+
+    # Versioned buckets also keep noncurrent versions and delete markers,
+    # which block bucket deletion
     try:
-        tables = dynamodb.list_tables()['TableNames']
-        env_tables = [table for table in tables if table.startswith(environment_prefix)]
-        
-        for table_name in env_tables:
-            try:
-                print(f"Deleting DynamoDB table: {table_name}")
-                dynamodb.delete_table(TableName=table_name)
-                results['resources_cleaned'].append({
-                    'type': 'dynamodb_table',
-                    'name': table_name,
-                    'status': 'deleted'
-                })
-            except Exception as e:
-                print(f"Error deleting table {table_name}: {str(e)}")
-                results['resources_cleaned'].append({
-                    'type': 'dynamodb_table',
-                    'name': table_name,
-                    'status': 'error',
-                    'error': str(e)
-                })
-                
-    except Exception as e:
-        print(f"Error listing DynamoDB tables: {str(e)}")
+        versions = []
+        for page in S3.get_paginator('list_object_versions').paginate(Bucket=bucket_name):
+            for version in page.get('Versions', []) + page.get('DeleteMarkers', []):
+                versions.append({'Key': version['Key'], 'VersionId': version['VersionId']})
+        delete_in_batches(versions)
+    except ClientError as e:
+        print(f"Error deleting object versions from bucket {bucket_name}: {str(e)}")
 
 def cleanup_s3_buckets(environment_prefix: str, results: Dict) -> None:
     """
     Delete S3 buckets matching the environment prefix
     """
-    s3 = boto3.client('s3')
-    
+    def delete_bucket(bucket_name: str) -> None:
+        try:
+            print(f"Deleting S3 bucket: {bucket_name}")
+
+            # Delete all objects in bucket first
+            try:
+                empty_bucket(bucket_name)
+            except ClientError as e:
+                print(f"Error deleting objects from bucket {bucket_name}: {str(e)}")
+            
+            # Delete the bucket
+            S3.delete_bucket(Bucket=bucket_name)
+            record_result(results, Result('s3_bucket', bucket_name, 'deleted'))
+            
+        except ClientError as e:
+            if error_code(e) == 'NoSuchBucket':
+                # Already gone - idempotent success
+                record_result(results, Result('s3_bucket', bucket_name, 'deleted'))
+                return
+            print(f"Error deleting bucket {bucket_name}: {str(e)}")
+            record_result(results, Result('s3_bucket', bucket_name, 'error', str(e)))
+
     try:
-        buckets = s3.list_buckets()['Buckets']
+        buckets = S3.list_buckets()['Buckets']
         env_buckets = [bucket['Name'] for bucket in buckets if bucket['Name'].startswith(environment_prefix)]
         
-        for bucket_name in env_buckets:
-            try:
-                print(f"Deleting S3 bucket: {bucket_name}")
-                
-                # Delete all objects in bucket first
-                try:
-                    objects = s3.list_objects_v2(Bucket=bucket_name)
-                    if 'Contents' in objects:
-                        delete_keys = [{'Key': obj['Key']} for obj in objects['Contents']]
-                        s3.delete_objects(
-                            Bucket=bucket_name,
-                            Delete={'Objects': delete_keys}
-                        )
-                except Exception as e:
-                    print(f"Error deleting objects from bucket {bucket_name}: {str(e)}")
+        run_deletions(delete_bucket, env_buckets)
                 
-                # Delete the bucket
-                s3.delete_bucket(Bucket=bucket_name)
-                results['resources_cleaned'].append({
-                    'type': 's3_bucket',
-                    'name': bucket_name,
-                    'status': 'deleted'
-                })
-                
-            except Exception as e:
-                print(f"Error deleting bucket {bucket_name}: {str(e)}")
-                results['resources_cleaned'].append({
-                    'type': 's3_bucket',
-                    'name': bucket_name,
-                    'status': 'error',
-                    'error': str(e)
-                })
-                
-    except Exception as e:
+    except ClientError as e:
         print(f"Error listing S3 buckets: {str(e)}")
 
 def cleanup_eventbridge_buses(environment_prefix: str, results: Dict) -> None:
     """
     Delete EventBridge custom buses matching the environment prefix
     """
-    events = boto3.client('events')
-    
+    def delete_bus(bus_name: str) -> None:
+        try:
+            print(f"Deleting EventBridge bus: {bus_name}")
+            EVENTS.delete_event_bus(Name=bus_name)
+            record_result(results, Result('eventbridge_bus', bus_name, 'deleted'))
+        except ClientError as e:
+            if error_code(e) == 'ResourceNotFoundException':
+                # Already gone - idempotent success
+                record_result(results, Result('eventbridge_bus', bus_name, 'deleted'))
+                return
+            print(f"Error deleting EventBridge bus {bus_name}: {str(e)}")
+            record_result(results, Result('eventbridge_bus', bus_name, 'error', str(e)))
+
     try:
-        buses = events.list_event_buses()['EventBuses']
-        env_buses = [bus['Name'] for bus in buses if bus['Name'].startswith(environment_prefix)]
+        env_buses = []
+        next_token = None
+        while True:
+            kwargs = {'NextToken': next_token} if next_token else {}
+            response = EVENTS.list_event_buses(**kwargs)
+            env_buses.extend(bus['Name'] for bus in response['EventBuses'] if bus['Name'].startswith(environment_prefix))
+            next_token = response.get('NextToken')
+            if not next_token:
+                break
         
-        for bus_name in env_buses:
-            try:
-                print(f"Deleting EventBridge bus: {bus_name}")
-                events.delete_event_bus(Name=bus_name)
-                results['resources_cleaned'].append({
-                    'type': 'eventbridge_bus',
-                    'name': bus_name,
-                    'status': 'deleted'
-                })
-            except Exception as e:
-                print(f"Error deleting EventBridge bus {bus_name}: {str(e)}")
-                results['resources_cleaned'].append({
-                    'type': 'eventbridge_bus',
-                    'name': bus_name,
-                    'status': 'error',
-                    'error': str(e)
-                })
+        run_deletions(delete_bus, env_buses)
                 
-    except Exception as e:
+    except ClientError as e:
         print(f"Error listing EventBridge buses: {str(e)}")
 
 def cleanup_cloudwatch_logs(environment_prefix: str, results: Dict) -> None:
     """
     Delete CloudWatch log groups matching the environment prefix
     """
-    logs = boto3.client('logs')
-    
+    def delete_log_group(log_group_name: str) -> None:
+        try:
+            print(f"Deleting CloudWatch log group: {log_group_name}")
+            LOGS.delete_log_group(logGroupName=log_group_name)
+            record_result(results, Result('cloudwatch_log_group', log_group_name, 'deleted'))
+        except ClientError as e:
+            if error_code(e) == 'ResourceNotFoundException':
+                # Already gone - idempotent success
+                record_result(results, Result('cloudwatch_log_group', log_group_name, 'deleted'))
+                return
+            print(f"Error deleting log group {log_group_name}: {str(e)}")
+            record_result(results, Result('cloudwatch_log_group', log_group_name, 'error', str(e)))
+
     try:
-        paginator = logs.get_paginator('describe_log_groups')
+        paginator = LOGS.get_paginator('describe_log_groups')
         
+        env_log_groups = []
         for page in paginator.paginate():
             log_groups = page['logGroups']
-            env_log_groups = [lg['logGroupName'] for lg in log_groups if environment_prefix in lg['logGroupName']]
-            
-            for log_group_name in env_log_groups:
-                try:
-                    print(f"Deleting CloudWatch log group: {log_group_name}")
-                    logs.delete_log_group(logGroupName=log_group_name)
-                    results['resources_cleaned'].append({
-                        'type': 'cloudwatch_log_group',
-                        'name': log_group_name,
-                        'status': 'deleted'
-                    })
-                except Exception as e:
-                    print(f"Error deleting log group {log_group_name}: {str(e)}")
-                    results['resources_cleaned'].append({
-                        'type': 'cloudwatch_log_group',
-                        'name': log_group_name,
-                        'status': 'error',
-                        'error': str(e)
-                    })
+            env_log_groups.extend(lg['logGroupName'] for lg in log_groups if environment_prefix in lg['logGroupName'])
+        
+        run_deletions(delete_log_group, env_log_groups)
                     
-    except Exception as e:
+    except ClientError as e:
         print(f"Error listing CloudWatch log groups: {str(e)}")
 
 if __name__ == "__main__":